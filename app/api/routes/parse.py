@@ -1,6 +1,9 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from typing import List, Optional
 
-from app.core.schemas import ParseResponse
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query
+from fastapi.responses import Response
+
+from app.core.schemas import MinimalParseResponse, ParseResponse
 from app.core.text_parser import parse_text_to_response
 from app.core.docx_extractor import extract_docx_lines
 from app.core.line_parser import parse_lines_to_response
@@ -9,6 +12,36 @@ from app.core.pdf_extractor import extract_pdf_lines
 router = APIRouter(tags=["parse"])
 
 
+def _parse_upload(raw: bytes, filename: Optional[str], content_type: Optional[str]) -> ParseResponse:
+    """Dispatch raw upload bytes to the extractor matching the file type."""
+    name = (filename or "").lower()
+    ctype = (content_type or "").lower()
+
+    # DOCX
+    if name.endswith(".docx") or ctype in {
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    }:
+        paras = extract_docx_lines(raw)
+        lines = [(f"docx:paragraph:{i}", text) for i, text in paras]
+        return parse_lines_to_response(lines, source="docx")
+    # PDF
+    if name.endswith(".pdf") or ctype == "application/pdf":
+        lines = extract_pdf_lines(raw)
+        if not lines:
+            raise HTTPException(
+                status_code=422,
+                detail="PDF appears to have no extractable text. OCR not enabled yet for this phase."
+            )
+        return parse_lines_to_response(lines, source="pdf")
+
+    # Text
+    if ctype in {"text/plain", "text/markdown", "application/json"} or name.endswith((".txt", ".md")):
+        text = raw.decode("utf-8", errors="replace")
+        return parse_text_to_response(text, source="user")
+
+    raise HTTPException(status_code=415, detail=f"Unsupported content type for now: {content_type}")
+
+
 @router.post(
     "/parse",
     response_model=ParseResponse,
@@ -16,29 +49,58 @@ router = APIRouter(tags=["parse"])
     description="Extract structured candidate information from a resume file (DOCX, PDF, or TXT). Returns extracted fields with evidence tracking and confidence scores.",
     responses={
         200: {
-            "description": "Successfully parsed resume",
+            "description": (
+                "Successfully parsed resume. With minimal=true the body is a "
+                "MinimalParseResponse: no evidence_map, and confidence_scores "
+                "entries carry no reasons."
+            ),
             "content": {
                 "application/json": {
-                    "example": {
-                        "candidate_profile": {
-                            "full_name": "John Doe",
-                            "email": "john@example.com",
-                            "phone": "(555) 123-4567",
-                            "location": "San Francisco, CA",
-                            "skills": ["Python", "FastAPI", "PostgreSQL"],
-                            "experiences": [
-                                {
-                                    "company": "Tech Corp",
-                                    "job_title": "Senior Engineer",
+                    "examples": {
+                        "full": {
+                            "summary": "Default response",
+                            "value": {
+                                "candidate_profile": {
+                                    "full_name": "John Doe",
+                                    "email": "john@example.com",
+                                    "phone": "(555) 123-4567",
                                     "location": "San Francisco, CA",
-                                    "start_date": "01/2020",
-                                    "end_date": "Present"
-                                }
-                            ]
+                                    "skills": ["Python", "FastAPI", "PostgreSQL"],
+                                    "experiences": [
+                                        {
+                                            "company": "Tech Corp",
+                                            "job_title": "Senior Engineer",
+                                            "location": "San Francisco, CA",
+                                            "start_date": "01/2020",
+                                            "end_date": "Present"
+                                        }
+                                    ]
+                                },
+                                "parse_quality": "high",
+                                "evidence_map": {},
+                                "warnings": []
+                            }
                         },
-                        "parse_quality": "high",
-                        "evidence_map": {},
-                        "warnings": []
+                        "minimal": {
+                            "summary": "minimal=true",
+                            "value": {
+                                "candidate_profile": {
+                                    "full_name": "John Doe",
+                                    "email": "john@example.com",
+                                    "skills": ["Python", "FastAPI", "PostgreSQL"]
+                                },
+                                "confidence_scores": {
+                                    "email": {
+                                        "field_name": "email",
+                                        "confidence": 1.0,
+                                        "extraction_method": "regex_exact",
+                                        "required": True
+                                    }
+                                },
+                                "parse_quality": "high",
+                                "warnings": []
+                            }
+                        }
                     }
                 }
             }
@@ -49,7 +111,8 @@ router = APIRouter(tags=["parse"])
     }
 )
 async def parse_resume(
-    file: UploadFile = File(..., description="Resume file (DOCX, PDF, or TXT format)")
+    file: UploadFile = File(..., description="Resume file (DOCX, PDF, or TXT format)"),
+    minimal: bool = Query(False, description="Omit evidence_map and confidence reasons from the response"),
 ):
     """
     Parse a resume file and extract candidate information.
@@ -65,34 +128,49 @@ async def parse_resume(
     - **parse_quality**: Overall quality assessment (high/medium/low)
     - **confidence_scores**: Per-field confidence metadata
     - **warnings**: Any warnings during parsing
+
+    With `minimal=true`, evidence_map and the per-field confidence reasons are
+    left out of the response.
     """
     raw = await file.read()
     if not raw:
         raise HTTPException(status_code=400, detail="Empty file uploaded.")
 
-    filename = (file.filename or "").lower()
-    content_type = (file.content_type or "").lower()
+    result = _parse_upload(raw, file.filename, file.content_type)
+    if minimal:
+        # Validated against MinimalParseResponse here, since a returned Response skips response_model
+        minimal_result = MinimalParseResponse.model_validate(result, from_attributes=True)
+        return Response(content=minimal_result.model_dump_json(), media_type="application/json")
+    return result
 
-    # DOCX
-    if filename.endswith(".docx") or content_type in {
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-    }:
-        paras = extract_docx_lines(raw)
-        lines = [(f"docx:paragraph:{i}", text) for i, text in paras]
-        return parse_lines_to_response(lines, source="docx")
-    # PDF
-    if filename.endswith(".pdf") or content_type == "application/pdf":
-        lines = extract_pdf_lines(raw)
-        if not lines:
-            raise HTTPException(
-                status_code=422,
-                detail="PDF appears to have no extractable text. OCR not enabled yet for this phase."
-            )
-        return parse_lines_to_response(lines, source="pdf")
 
-    # Text
-    if content_type in {"text/plain", "text/markdown", "application/json"} or filename.endswith((".txt", ".md")):
-        text = raw.decode("utf-8", errors="replace")
-        return parse_text_to_response(text, source="user")
+@router.post(
+    "/parse/batch",
+    response_model=List[ParseResponse],
+    summary="Parse Resume Batch",
+    description="Parse several resume files in one request. Results are returned in upload order.",
+    responses={
+        400: {"description": "One of the uploaded files is empty"},
+        415: {"description": "Unsupported file format"},
+        422: {"description": "File has no extractable text"}
+    }
+)
+async def parse_resume_batch(
+    files: List[UploadFile] = File(..., description="Resume files (DOCX, PDF, or TXT format)")
+):
+    """
+    Parse multiple resume files in a single request.
 
-    raise HTTPException(status_code=415, detail=f"Unsupported content type for now: {file.content_type}")
+    Each file goes through the same pipeline as `/parse`. The batch fails as a
+    whole if any file is rejected; the error detail names the offending file.
+    """
+    results: List[ParseResponse] = []
+    for file in files:
+        raw = await file.read()
+        if not raw:
+            raise HTTPException(status_code=400, detail=f"Empty file uploaded: {file.filename}")
+        try:
+            results.append(_parse_upload(raw, file.filename, file.content_type))
+        except HTTPException as exc:
+            raise HTTPException(status_code=exc.status_code, detail=f"{file.filename}: {exc.detail}") from exc
+    return results
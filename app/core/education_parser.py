@@ -37,10 +37,10 @@ def normalize_pdf_wordbreaks(s: str) -> str:
         return s
     # Only remove spaces in CLEAR artifact patterns:
     # 1) Multiple spaces between letters (obvious artifact)
-    s = re.sub(r"(?<=[A-Za-z])\s{2,}(?=[A-Za-z])", "", s)
+    s = PDF_MULTI_SPACE_BREAK_RE.sub("", s)
     # 2) Single space between lowercase letters only (very likely mid-word break)
     #    This avoids removing spaces in proper word boundaries
-    s = re.sub(r"(?<=[a-z])\s(?=[a-z])", "", s)
+    s = PDF_LOWER_SPACE_BREAK_RE.sub("", s)
     return s
 
 
@@ -163,6 +163,51 @@ EDUCATION_DETAIL_KEYWORDS = {
     "coursework:",
 }
 
+# ===== COMPILED PATTERNS =====
+# Compiled once at import; the per-entry parsing paths below reuse them.
+
+PDF_MULTI_SPACE_BREAK_RE = re.compile(r"(?<=[A-Za-z])\s{2,}(?=[A-Za-z])")
+PDF_LOWER_SPACE_BREAK_RE = re.compile(r"(?<=[a-z])\s(?=[a-z])")
+WHITESPACE_RUN_RE = re.compile(r"\s+")
+
+# Longer degree names first (longer match wins)
+DEGREE_PATTERNS = [
+    re.compile(r"(bachelor of science|bachelor's degree|master of science|master's degree|associate of|bachelor of arts|master of arts|doctor of philosophy)"),
+    re.compile(r"(b\.s\.(?:\s+in)?|b\.a\.(?:\s+in)?|m\.s\.(?:\s+in)?|m\.a\.(?:\s+in)?|m\.b\.a\.(?:\s+in)?|ph\.d\.(?:\s+in)?)"),
+    re.compile(r"(bachelor|master|associate|doctorate|doctoral|phd|graduate degree|postgraduate degree)"),
+]
+
+# "in <field>" up to a comma or end of line
+FIELD_AFTER_IN_RE = re.compile(r"\bin\s+([A-Za-z\s&/\-]+?)(?:\s*(?:,|$|[\n\r]))", re.IGNORECASE)
+# Same, but also stops at an inline bullet (used on joined entry text)
+FIELD_AFTER_IN_BULLET_STOP_RE = re.compile(r"\bin\s+([A-Za-z\s&/\-]+?)(?:\s*(?:,|$|[\n\r●•\-\*]))", re.IGNORECASE)
+# Title-cased words after a bare degree keyword ("Bachelor of Science Engineering")
+FIELD_AFTER_DEGREE_KEYWORD_RE = re.compile(
+    "(?:" + "|".join(re.escape(k) for k in ["bachelor", "master", "associate", "phd", "doctorate"]) + ")"
+    + r"\s+(?:of\s+)?[a-z]+\s+([A-Za-z\s&/\-]+?)(?:,|$)",
+    re.IGNORECASE
+)
+
+STUDY_ABROAD_CITY_RE = re.compile(r",\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)$")
+STUDY_ABROAD_SUFFIX_RE = re.compile(r"\s+[Ss]tudy\s+[Aa]broad\s*$")
+STUDY_ABROAD_ABBREVIATION_PATTERNS = [
+    (re.compile(r"^" + re.escape(abbrev) + r"\s+", re.IGNORECASE), full_name)
+    for abbrev, full_name in STUDY_ABROAD_ABBREVIATIONS.items()
+]
+
+EDUCATION_BULLET_RE = re.compile(r"^[\s•●\-\*\→\>]+")
+# Study abroad location/date pattern: "Copenhagen, Denmark, Spring Trimester – 2015"
+STUDY_ABROAD_LOC_LINE_RE = re.compile(
+    r"^(?P<city>[^,]+),\s*(?P<country>[^,]+),\s*(?P<term>.+?)\s*[–-]\s*(?P<year>(19|20)\d{2})\s*$",
+    re.IGNORECASE
+)
+DATE_RANGE_SPLIT_RE = re.compile(r"\s*(?:-|–|to)\s*", re.IGNORECASE)
+TERM_YEAR_RE = re.compile(r"(Spring|Fall|Winter|Summer)\s+(Trimester|Semester|Term)\s+(\d{4})", re.IGNORECASE)
+YEAR_ONLY_RE = re.compile(r"^\d{4}$")
+
+# Details matching any of these are dropped (e.g. "References Available Upon Request")
+JUNK_DETAIL_RE = re.compile(r"references available upon request|available upon request|contact|phone|email")
+
 
 def detect_section_type(line: str) -> Optional[Literal["education", "experience"]]:
     """
@@ -178,7 +223,7 @@ def detect_section_type(line: str) -> Optional[Literal["education", "experience"
     # CRITICAL: Fix PDF wordbreaks (e.g., "educati on" -> "education") BEFORE matching
     normalized = normalize_pdf_wordbreaks(normalized)
     normalized = normalized.lower()
-    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = WHITESPACE_RUN_RE.sub(" ", normalized)
     
     # Check education headers
     if normalized in EDUCATION_SECTION_HEADERS:
@@ -311,15 +356,8 @@ def extract_degree_from_text(text: str) -> Optional[str]:
     text = normalize_pdf_wordbreaks(text)
     text_lower = text.lower()
     
-    # Longer degree names first (longer match wins)
-    degree_patterns = [
-        r"(bachelor of science|bachelor's degree|master of science|master's degree|associate of|bachelor of arts|master of arts|doctor of philosophy)",
-        r"(b\.s\.(?:\s+in)?|b\.a\.(?:\s+in)?|m\.s\.(?:\s+in)?|m\.a\.(?:\s+in)?|m\.b\.a\.(?:\s+in)?|ph\.d\.(?:\s+in)?)",
-        r"(bachelor|master|associate|doctorate|doctoral|phd|graduate degree|postgraduate degree)",
-    ]
-    
-    for pattern in degree_patterns:
-        match = re.search(pattern, text_lower)
+    for pattern in DEGREE_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             # Get the matched degree text from original (preserve casing where possible)
             start = match.start()
@@ -349,7 +387,7 @@ def extract_field_of_study_from_degree_line(text: str) -> Optional[str]:
     
     # Look for "in <field>" pattern, but stop at common delimiters like commas
     # This prevents capturing location information
-    match = re.search(r"\bin\s+([A-Za-z\s&/\-]+?)(?:\s*(?:,|$|[\n\r]))", text, re.IGNORECASE)
+    match = FIELD_AFTER_IN_RE.search(text)
     if match:
         field = match.group(1).strip()
         # Avoid capturing location keywords (City, Country)
@@ -360,8 +398,7 @@ def extract_field_of_study_from_degree_line(text: str) -> Optional[str]:
             return field
     
     # Fallback: look for title-cased words after degree keyword
-    degree_keywords_pattern = "|".join(re.escape(k) for k in ["bachelor", "master", "associate", "phd", "doctorate"])
-    match = re.search(f"(?:{degree_keywords_pattern})\\s+(?:of\\s+)?[a-z]+\\s+([A-Za-z\\s&/\\-]+?)(?:,|$)", text, re.IGNORECASE)
+    match = FIELD_AFTER_DEGREE_KEYWORD_RE.search(text)
     if match:
         field = match.group(1).strip()
         return field
@@ -428,7 +465,7 @@ def _extract_location_from_study_abroad(text: str) -> Optional[str]:
     """
     # Look for comma followed by a single city name
     # Pattern: "DIS Study Abroad, Copenhagen" -> "Copenhagen"
-    match = re.search(r",\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)$", text)
+    match = STUDY_ABROAD_CITY_RE.search(text)
     if match:
         location = match.group(1).strip()
         # Validate it's a reasonable location name (at least 4 chars, no numbers)
@@ -453,16 +490,15 @@ def _expand_study_abroad_abbreviation(institution_text: str) -> str:
     Returns:
         Institution text with abbreviations expanded and deduplicated
     """
-    for abbrev, full_name in STUDY_ABROAD_ABBREVIATIONS.items():
+    for pattern, full_name in STUDY_ABROAD_ABBREVIATION_PATTERNS:
         # Match abbreviation at start of text (case-insensitive)
-        pattern = re.compile(r"^" + re.escape(abbrev) + r"\s+", re.IGNORECASE)
         if pattern.match(institution_text):
             # Replace abbreviation with full name
             expanded = pattern.sub(full_name + " ", institution_text)
             
             # Remove trailing "Study Abroad" if the full name already contains it
             if "study abroad" in full_name.lower() and expanded.lower().endswith("study abroad"):
-                expanded = re.sub(r"\s+[Ss]tudy\s+[Aa]broad\s*$", "", expanded).strip()
+                expanded = STUDY_ABROAD_SUFFIX_RE.sub("", expanded).strip()
             
             return expanded.strip()
     
@@ -506,8 +542,7 @@ def parse_education_entry(
     # CRITICAL: Check if first line is a BULLET before splitting on colon
     # Bullets with colons (e.g., "● Applied Communications Major: Social Media/Marketing")
     # must be preserved as details, not parsed as headers
-    bullet_re = re.compile(r"^[\s•●\-\*\→\>]+")
-    is_first_line_bullet = bullet_re.match(first_text)
+    is_first_line_bullet = EDUCATION_BULLET_RE.match(first_text)
     
     # Try to split first line on colon (common format: "UNIVERSITY: Degree")
     # BUT ONLY if it's NOT a bullet line
@@ -529,11 +564,7 @@ def parse_education_entry(
         if degree:
             # Search for the " in <field>" pattern in the original degree_part
             # to extract field_of_study without mangling multi-word degrees
-            field_match = re.search(
-                r"\bin\s+([A-Za-z\s&/\-]+?)(?:\s*(?:,|$|[\n\r]))",
-                degree_part,
-                re.IGNORECASE
-            )
+            field_match = FIELD_AFTER_IN_RE.search(degree_part)
             if field_match:
                 field = field_match.group(1).strip()
                 if field and len(field) > 2:
@@ -558,11 +589,7 @@ def parse_education_entry(
         degree = extract_degree_from_text(combined_text)
         if degree:
             # Search for the " in <field>" pattern in the combined_text
-            field_match = re.search(
-                r"\bin\s+([A-Za-z\s&/\-]+?)(?:\s*(?:,|$|[\n\r●•\-\*]))",
-                combined_text,
-                re.IGNORECASE
-            )
+            field_match = FIELD_AFTER_IN_BULLET_STOP_RE.search(combined_text)
             if field_match:
                 field = field_match.group(1).strip()
                 if field and len(field) > 2:
@@ -636,12 +663,6 @@ def parse_education_entry(
     # Import here to avoid circular imports
     from app.core.line_parser import _extract_location_from_line, DATE_RANGE_RE
     
-    # Study abroad location/date pattern: "Copenhagen, Denmark, Spring Trimester – 2015"
-    STUDY_ABROAD_LOC_LINE = re.compile(
-        r"^(?P<city>[^,]+),\s*(?P<country>[^,]+),\s*(?P<term>.+?)\s*[–-]\s*(?P<year>(19|20)\d{2})\s*$",
-        re.IGNORECASE
-    )
-    
     for text in lines_to_process:
         t = text.strip()
         
@@ -651,8 +672,8 @@ def parse_education_entry(
         
         # CRITICAL: Handle bullets FIRST (before any other logic)
         # Bullets are ALWAYS details, never headers or entry boundaries
-        if bullet_re.match(t):
-            detail_text = bullet_re.sub("", t).strip()
+        if EDUCATION_BULLET_RE.match(t):
+            detail_text = EDUCATION_BULLET_RE.sub("", t).strip()
             if detail_text and 5 < len(detail_text) < 500:
                 education.details.append(detail_text)
             continue
@@ -660,7 +681,7 @@ def parse_education_entry(
         # Check for study abroad location/date pattern FIRST (before normal location extraction)
         # This prevents "Denmark, Spring" from being matched as a location
         # Study abroad pattern: "Copenhagen, Denmark, Spring Trimester – 2015"
-        study_abroad_match = STUDY_ABROAD_LOC_LINE.match(t)
+        study_abroad_match = STUDY_ABROAD_LOC_LINE_RE.match(t)
         if study_abroad_match and not education.location:
             city = study_abroad_match.group('city').strip()
             country = study_abroad_match.group('country').strip()
@@ -686,7 +707,7 @@ def parse_education_entry(
         dates_match = DATE_RANGE_RE.search(t)
         if dates_match:
             matched = dates_match.group(0).strip()
-            parts = re.split(r"\s*(?:-|–|to)\s*", matched, flags=re.IGNORECASE)
+            parts = DATE_RANGE_SPLIT_RE.split(matched)
             if len(parts) >= 2:
                 # Only set start_date if not already set
                 if not education.start_date:
@@ -697,7 +718,7 @@ def parse_education_entry(
         
         # Special case: Trimester/Semester format (e.g., "Spring Trimester 2015", "Fall Semester 2016")
         if not has_dates and not education.end_date:
-            trimester_match = re.search(r"(Spring|Fall|Winter|Summer)\s+(Trimester|Semester|Term)\s+(\d{4})", t, re.IGNORECASE)
+            trimester_match = TERM_YEAR_RE.search(t)
             if trimester_match:
                 year = trimester_match.group(3)
                 term = trimester_match.group(1)
@@ -734,27 +755,17 @@ def parse_education_entry(
             education.details.append(t)
     
     # Validation: Remove junk details like "References Available Upon Request"
-    junk_patterns = [
-        r"references available upon request",
-        r"available upon request",
-        r"contact",
-        r"phone",
-        r"email",
-    ]
-    
     cleaned_details = []
     for detail in education.details:
         is_junk = False
-        for pattern in junk_patterns:
-            if re.search(pattern, detail.lower()):
-                is_junk = True
-                warnings.append(f"Removed junk detail from education entry: {detail}")
-                break
+        if JUNK_DETAIL_RE.search(detail.lower()):
+            is_junk = True
+            warnings.append(f"Removed junk detail from education entry: {detail}")
         
         # Also filter out detail lines that are just numbers (likely orphaned dates)
-        if not is_junk and detail.strip() and not re.match(r"^\d{4}$", detail.strip()):
+        if not is_junk and detail.strip() and not YEAR_ONLY_RE.match(detail.strip()):
             cleaned_details.append(detail)
-        elif re.match(r"^\d{4}$", detail.strip()):
+        elif YEAR_ONLY_RE.match(detail.strip()):
             # Log that we're removing a year-only detail
             warnings.append(f"Removed orphaned year from education details: {detail}")
     
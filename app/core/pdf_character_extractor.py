@@ -8,11 +8,12 @@ Phase 2a: Geometric-first approach (experimental).
 """
 
 from typing import Dict, List, Tuple, Optional
+from operator import attrgetter, itemgetter
 import pdfplumber
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFCharacter:
     """Represents a single character with its geometric properties."""
     page: int
@@ -35,7 +36,7 @@ class PDFCharacter:
         return self.y0 - self.y0  # Usually not used, but included for completeness
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFWord:
     """Represents a word reconstructed from characters."""
     text: str
@@ -52,7 +53,7 @@ class PDFWord:
         return f"pdf:page:{self.page}:word:{self.x0:.1f}_{self.y0:.1f}"
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFLine:
     """Represents a line of text (multiple words)."""
     page: int
@@ -70,6 +71,14 @@ class PDFLine:
         return f"pdf:page:{self.page}:line:{self.y_position:.1f}"
 
 
+_VOWELS = frozenset("aeiou")
+
+# Sort keys for characters/words (C-level attribute fetch instead of a lambda per item)
+_BY_X0 = attrgetter("x0")
+# Line buckets sort by (page, y) only; never fall through to comparing word lists
+_BY_KEY = itemgetter(0)
+
+
 def extract_characters_with_geometry(pdf_path: str) -> List[PDFCharacter]:
     """
     Extract all characters from a PDF with their geometric properties.
@@ -133,9 +142,7 @@ def reconstruct_words_from_chars(
     # Group characters by page
     by_page: Dict[int, List[PDFCharacter]] = {}
     for char in characters:
-        if char.page not in by_page:
-            by_page[char.page] = []
-        by_page[char.page].append(char)
+        by_page.setdefault(char.page, []).append(char)
     
     words = []
     
@@ -217,15 +224,13 @@ def _segment_line_into_words(
         return []
     
     # Sort by x position (left to right)
-    line_chars.sort(key=lambda c: c.x0)
+    line_chars.sort(key=_BY_X0)
     
     words = []
     current_word_chars = [line_chars[0]]
     
-    for i in range(1, len(line_chars)):
-        prev_char = line_chars[i - 1]
-        curr_char = line_chars[i]
-        
+    # Walk adjacent (prev, curr) pairs directly rather than indexing the list twice per step
+    for prev_char, curr_char in zip(line_chars, line_chars[1:]):
         # Calculate gap between characters
         gap = curr_char.x0 - prev_char.x1
         
@@ -263,11 +268,19 @@ def _segment_line_into_words(
 
 def _build_word(chars: List[PDFCharacter]) -> PDFWord:
     """Construct a PDFWord from a list of characters."""
-    text = "".join(c.char for c in chars)
-    x0 = min(c.x0 for c in chars)
-    x1 = max(c.x1 for c in chars)
-    y0 = min(c.y0 for c in chars)
-    y1 = max(c.y1 for c in chars)
+    text = "".join([c.char for c in chars])
+    # Bounding box in one pass over the characters
+    first = chars[0]
+    x0, x1, y0, y1 = first.x0, first.x1, first.y0, first.y1
+    for c in chars[1:]:
+        if c.x0 < x0:
+            x0 = c.x0
+        if c.x1 > x1:
+            x1 = c.x1
+        if c.y0 < y0:
+            y0 = c.y0
+        if c.y1 > y1:
+            y1 = c.y1
     
     return PDFWord(
         text=text,
@@ -299,14 +312,12 @@ def reconstruct_lines_from_words(words: List[PDFWord]) -> List[PDFLine]:
     for word in words:
         # Cluster words by y position (same line)
         line_key = (word.page, round(word.y0 / 2, 0) * 2)  # Round y to nearest 2 units
-        if line_key not in by_page_and_line:
-            by_page_and_line[line_key] = []
-        by_page_and_line[line_key].append(word)
+        by_page_and_line.setdefault(line_key, []).append(word)
     
     # Sort words within each line by x position
     lines = []
-    for (page, y), line_words in sorted(by_page_and_line.items()):
-        line_words.sort(key=lambda w: w.x0)
+    for (page, y), line_words in sorted(by_page_and_line.items(), key=_BY_KEY):
+        line_words.sort(key=_BY_X0)
         lines.append(PDFLine(page=page, y_position=y, words=line_words))
     
     return lines
@@ -349,16 +360,20 @@ def compute_extraction_quality(words: List[PDFWord]) -> Dict:
     no_vowel_count = 0
     long_words = 0
     total_length = 0
+    alphanumeric_words = 0
     
     suspicious_words = set()  # Track suspicious word indices to avoid double-counting
     
-    for idx, word in enumerate(words):
-        text = word.text.strip()
-        
+    # Scoring only reads the text, so walk that column once instead of
+    # going back through the PDFWord objects for each signal
+    texts = [word.text.strip() for word in words]
+    
+    for idx, text in enumerate(texts):
         # Skip punctuation-only words
         if not text or not any(c.isalpha() for c in text):
             continue
         
+        alphanumeric_words += 1
         total_length += len(text)
         text_lower = text.lower()
         
@@ -371,9 +386,8 @@ def compute_extraction_quality(words: List[PDFWord]) -> Dict:
             long_words += 1
             suspicious_words.add(idx)
         
-        # Check for lack of vowels
-        vowel_count = sum(1 for c in text_lower if c in 'aeiou')
-        if len(text) > 3 and vowel_count == 0:
+        # Check for lack of vowels (set-disjointness test runs in C, no per-char loop)
+        if len(text) > 3 and _VOWELS.isdisjoint(text_lower):
             no_vowel_count += 1
             suspicious_words.add(idx)
         
@@ -382,7 +396,6 @@ def compute_extraction_quality(words: List[PDFWord]) -> Dict:
             suspicious_words.add(idx)
     
     # Calculate ratios
-    alphanumeric_words = sum(1 for w in words if any(c.isalpha() for c in w.text))
     suspicious_count = len(suspicious_words)
     dict_coverage = dict_coverage_count / max(alphanumeric_words, 1)
     no_vowel_ratio = no_vowel_count / max(alphanumeric_words, 1)
@@ -13,15 +13,23 @@ class EvidenceItem(BaseModel):
     confidence: float = Field(default=1.0, description="Confidence in this evidence (0.0-1.0). 1.0 = exact match, <1.0 = inferred/repaired")
 
 
-class FieldConfidence(BaseModel):
-    """Per-field confidence metadata. Tracks why confidence is what it is."""
+class FieldConfidenceBase(BaseModel):
+    """Per-field confidence fields shared by the full and minimal responses."""
     field_name: str
     confidence: float = Field(..., ge=0.0, le=1.0, description="0.0 (no confidence) to 1.0 (absolute certainty)")
     extraction_method: str = Field(..., description="How it was extracted (e.g., 'regex_exact', 'heuristic', 'format_inference')")
-    reasons: List[str] = Field(default_factory=list, description="Why confidence is this value")
     required: bool = Field(default=False, description="Is this field required for 'high' parse quality?")
 
 
+class FieldConfidence(FieldConfidenceBase):
+    """Per-field confidence metadata. Tracks why confidence is what it is."""
+    reasons: List[str] = Field(default_factory=list, description="Why confidence is this value")
+
+
+class MinimalFieldConfidence(FieldConfidenceBase):
+    """FieldConfidence without `reasons`, as returned by /parse?minimal=true."""
+
+
 class EducationEntry(BaseModel):
     """Education entry in candidate profile."""
     institution: Optional[str] = None  # University, School, Institute name
@@ -54,3 +62,14 @@ class ParseResponse(BaseModel):
     )
     parse_quality: ParseQuality
     warnings: List[str] = Field(default_factory=list)
+
+
+class MinimalParseResponse(BaseModel):
+    """ParseResponse without evidence_map or confidence reasons (/parse?minimal=true)."""
+    candidate_profile: CandidateProfile
+    confidence_scores: Dict[str, MinimalFieldConfidence] = Field(
+        default_factory=dict,
+        description="Confidence metadata for each field, without reasons"
+    )
+    parse_quality: ParseQuality
+    warnings: List[str] = Field(default_factory=list)
@@ -17,6 +17,7 @@ from typing import Optional
 
 EMAIL_RE = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
 EMAIL_FLEX_RE = re.compile(r"([^\s@]+(?:\s+[^\s@]+)*)\s*(@)\s*([^\s@]+(?:\s+[^\s@]+)*)\s*\.\s*([A-Za-z]{2,})")
+EMAIL_STRICT_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
 
 
 def extract_email_flexible(text: str) -> Optional[str]:
@@ -57,7 +58,7 @@ def extract_email_flexible(text: str) -> Optional[str]:
     
     # Fallback: normal strict email pattern (requires @ with no spaces, excludes parens/phone chars)
     # Match: alphanumeric._%+- before @, then domain.tld, no parens allowed
-    m2 = re.search(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", text)
+    m2 = EMAIL_STRICT_RE.search(text)
     if m2:
         user = m2.group(0).split("@")[0]
         if not _user_looks_like_phone(user):
@@ -88,6 +89,8 @@ JOINER_SUFFIX_PHRASES = [
     ("andthe", "and the"),
 ]
 
+_JOINER_SUFFIXES = tuple(suf for suf, _ in JOINER_SUFFIX_PHRASES)
+
 JOINER_PREFIX_PHRASES = [
     ("dueto", "due to"),
     ("leadingto", "leading to"),
@@ -109,11 +112,16 @@ A_LEFT_WHITELIST = {"back", "won", "grew", "built", "led", "sold", "took"}
 
 # Resume-domain common words for glue evidence checks
 # Used to detect if a split is evidence of genuine glued text (not a real single word)
-COMMON_WORDS = {
+COMMON_WORDS = frozenset({
     "back", "large", "new", "role", "team", "month", "year", "account", "territory",
     "sales", "growth", "customers", "business", "country", "attend", "miami", "symposium",
     "conference", "leader", "expand", "market", "client", "revenue", "product", "service"
-}
+})
+
+# Patterns used per token by the helpers below, compiled once at import
+CONSONANT_CLUSTER_RE = re.compile(r"[bcdfghjklmnpqrstvwxz]{5,}")
+QUARTER_NUMBER_RE = re.compile(r"(\d{1,2})([,.\-]*)$")
+CAMEL_BOUNDARY_RE = re.compile(r"([a-z])([A-Z])")
 
 # Bullet-only exact fixes (highest precision)
 EXACT_TOKEN_FIXES = {
@@ -158,7 +166,7 @@ def _is_wordish(s: str) -> bool:
     if not _has_vowels(s):
         return False
     # Reject long consonant clusters (sign of glued text)
-    if re.search(r"[bcdfghjklmnpqrstvwxz]{5,}", s):
+    if CONSONANT_CLUSTER_RE.search(s):
         return False
     return True
 
@@ -181,7 +189,7 @@ def _strong_word(s: str) -> bool:
     if vowel_count < 2:
         return False
     # No extreme consonant clusters
-    if re.search(r"[bcdfghjklmnpqrstvwxz]{5,}", s):
+    if CONSONANT_CLUSTER_RE.search(s):
         return False
     return True
 
@@ -219,6 +227,9 @@ def _is_valid_piece(p: str) -> bool:
 
 def _apply_to_subtokens(s: str, fn) -> str:
     """Apply a token-level function to each space-delimited subtoken in a possibly multi-token string."""
+    # Most tokens are never split; skip the split/join round trip for them
+    if " " not in s:
+        return fn(s)
     parts = s.split()
     parts = [fn(p) for p in parts]
     return " ".join(parts)
@@ -341,9 +352,9 @@ def _merge_letter_number_pairs(tokens: list[str]) -> list[str]:
         if i + 1 < len(tokens):
             a, b = tokens[i], tokens[i + 1]
             # Q + digit(s), optionally with trailing punctuation
-            if a.upper() == "Q" and re.match(r"\d{1,2}[,.\-]*$", b):
+            if a.upper() == "Q":
                 # Extract digits and preserve trailing punctuation
-                digit_match = re.match(r"(\d{1,2})(.*)", b)
+                digit_match = QUARTER_NUMBER_RE.match(b)
                 if digit_match:
                     digits, trailing = digit_match.groups()
                     merged = "Q" + digits + trailing
@@ -359,35 +370,15 @@ def _merge_letter_number_pairs(tokens: list[str]) -> list[str]:
 # Step 1: Explicit special cases (highest precision)
 # ============================================================================
 
-def _fix_inanew(tok: str) -> str:
-    """Fix 'inanew' and 'anew' patterns."""
-    low = tok.lower()
-    if low == "anew":
-        return "a new"
-    if low == "inanew":
-        return "in a new"
-    return tok
-
-
-def _fix_startanew(tok: str) -> str:
-    """Fix 'startanew' pattern."""
-    if tok.lower() == "startanew":
-        return "start a new"
-    return tok
-
-
-def _fix_leadingto(tok: str) -> str:
-    """Fix 'leadingto' as standalone token."""
-    if tok.lower() == "leadingto":
-        return "leading to"
-    return tok
-
-
-def _fix_dueto(tok: str) -> str:
-    """Fix 'dueto' as standalone token."""
-    if tok.lower() == "dueto":
-        return "due to"
-    return tok
+# Whole-token fixes (inanew/anew, startanew, leadingto, dueto), keyed by the
+# lowercased token so one dict probe replaces a chain of comparisons
+SPECIAL_TOKEN_FIXES = {
+    "anew": "a new",
+    "inanew": "in a new",
+    "startanew": "start a new",
+    "leadingto": "leading to",
+    "dueto": "due to",
+}
 
 
 # ============================================================================
@@ -397,6 +388,9 @@ def _fix_dueto(tok: str) -> str:
 def _split_suffix_phrases(tok: str) -> str:
     """Peel off suffix phrases like 'inthe', 'ofthe', 'tobe'."""
     low = tok.lower()
+    # One C-level endswith over all suffixes rejects most tokens up front
+    if not low.endswith(_JOINER_SUFFIXES):
+        return tok
     for suf, repl in JOINER_SUFFIX_PHRASES:
         if low.endswith(suf) and len(low) >= len(suf) + 4:  # >= not >, and 4+ chars before suffix
             left = tok[:-len(suf)]
@@ -540,8 +534,10 @@ def _split_camel_joiner(tok: str) -> str:
     - SymposiuminMiami -> Symposium in Miami (after this + later steps)
     - growthinQ -> growth in Q
     """
-    # Look for lowercase->Uppercase transition
-    m = re.search(r"([a-z])([A-Z])", tok)
+    # Look for lowercase->Uppercase transition (impossible in single-case tokens)
+    if tok.islower() or tok.isupper():
+        return tok
+    m = CAMEL_BOUNDARY_RE.search(tok)
     if not m:
         return tok
     
@@ -583,20 +579,8 @@ def normalize_token_basic(token: str) -> str:
         return token
     
     # Step 1: Explicit special cases
-    tok = _fix_inanew(token)
-    if tok != token:
-        return tok
-    
-    tok = _fix_startanew(token)
-    if tok != token:
-        return tok
-    
-    tok = _fix_leadingto(token)
-    if tok != token:
-        return tok
-    
-    tok = _fix_dueto(token)
-    if tok != token:
+    tok = SPECIAL_TOKEN_FIXES.get(token.lower())
+    if tok is not None:
         return tok
     
     # Step 2: Suffix phrases
@@ -0,0 +1,25 @@
+from conftest import DOCX_CONTENT_TYPE, json_of
+
+
+def test_batch_returns_one_response_per_file_in_order(batch_results):
+    assert list(batch_results) == ["john_doe_pdf", "john_doe_docx"]
+    for data in batch_results.values():
+        assert data["candidate_profile"]["email"]
+        assert data["parse_quality"] in {"high", "medium", "low"}
+
+
+def test_batch_matches_single_file_parse(client, batch_results, fixture_bytes):
+    files = {"file": ("resume.docx", fixture_bytes["john_doe_docx"], DOCX_CONTENT_TYPE)}
+    r = client.post("/parse", files=files)
+    assert r.status_code == 200
+    assert json_of(r) == batch_results["john_doe_docx"]
+
+
+def test_batch_rejects_empty_file_and_names_it(client):
+    files = [
+        ("files", ("resume.txt", b"Jane Doe\njane@example.com\n", "text/plain")),
+        ("files", ("empty.txt", b"", "text/plain")),
+    ]
+    r = client.post("/parse/batch", files=files)
+    assert r.status_code == 400
+    assert "empty.txt" in json_of(r)["detail"]
@@ -4,13 +4,20 @@ This prevents education detail bullets like "● Applied Communications Major: S
 from being misclassified as experience entries.
 """
 
-from fastapi.testclient import TestClient
-from app.main import app
+import re
+from conftest import assert_details_contain, assert_no_bullet_companies, index_by, json_of, parse_text, post_parse
 
-client = TestClient(app)
+# Case-insensitive scans shared by the guard loops. No word boundaries: the
+# original substring checks also rejected e.g. "majors", so these stay as strict.
+_MAJOR_RE = re.compile(r"major", re.I)
+_MINOR_RE = re.compile(r"minor", re.I)
+_COMMUNICATIONS_RE = re.compile(r"communications", re.I)
+_SOCIAL_MEDIA_RE = re.compile(r"social media", re.I)
+_LED_TEAM_RE = re.compile(r"led team", re.I)
+_MANAGED_RE = re.compile(r"managed", re.I)
 
 
-def test_education_bullets_not_parsed_as_experiences():
+def test_education_bullets_not_parsed_as_experiences(client):
     """
     Regression test: Education detail bullets containing colons must NOT
     become separate experience entries.
@@ -48,34 +55,32 @@ January 2024 – Present
 ● Grew territory sales by 25%
 """.strip()
     
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
+    response = post_parse(client, resume_text)
     
     assert response.status_code == 200
-    data = response.json()
+    data = json_of(response)
     
     candidate = data["candidate_profile"]
     experiences = candidate.get("experiences", [])
     education = candidate.get("education", [])
     
     # Critical assertions: Bullets must NOT become experience entries
+    assert_no_bullet_companies(experiences)
     for exp in experiences:
-        company = (exp.get("company") or "").lower()
-        title = (exp.get("job_title") or "").lower()
+        company = exp.get("company") or ""
+        title = exp.get("job_title") or ""
         
         # These terms should NEVER appear in experience entries
-        assert "major" not in company, f"Education major incorrectly parsed as experience company: {company}"
-        assert "minor" not in company, f"Education minor incorrectly parsed as experience company: {company}"
-        assert "communications" not in company, f"Education field incorrectly parsed as experience: {company}"
-        assert "social media" not in title, f"Education detail incorrectly parsed as job title: {title}"
+        assert not _MAJOR_RE.search(company), f"Education major incorrectly parsed as experience company: {company}"
+        assert not _MINOR_RE.search(company), f"Education minor incorrectly parsed as experience company: {company}"
+        assert not _COMMUNICATIONS_RE.search(company), f"Education field incorrectly parsed as experience: {company}"
+        assert not _SOCIAL_MEDIA_RE.search(title), f"Education detail incorrectly parsed as job title: {title}"
     
     # Education should contain the bullets as details
     assert len(education) >= 1, "Education entry should exist"
     
     # Find Gonzaga entry
-    gonzaga = next((e for e in education if "gonzaga" in (e.get("institution") or "").lower()), None)
+    gonzaga = index_by(education, "institution").find("gonzaga")
     assert gonzaga is not None, "Gonzaga education entry should exist"
     
     # Gonzaga should have details (the bullet points)
@@ -83,9 +88,7 @@ January 2024 – Present
     assert len(details) >= 3, f"Gonzaga should have at least 3 detail bullets, got {len(details)}"
     
     # Check that the bullets are present in details
-    details_text = " ".join(details).lower()
-    assert "applied communications" in details_text, "Applied Communications bullet should be in education details"
-    assert "social media" in details_text or "marketing" in details_text, "Social Media/Marketing should be in education details"
+    assert_details_contain(details, "applied communications", ("social media", "marketing"))
 
 
 def test_no_experiences_start_with_bullets():
@@ -110,17 +113,13 @@ Account Manager
 ● Managed $2M portfolio
 """.strip()
     
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
-    
-    assert response.status_code == 200
-    data = response.json()
+    data = parse_text(resume_text)
     
     experiences = data["candidate_profile"].get("experiences", [])
     
-    # Check that no experience entry has a company name that looks like a bullet
+    # Company names should never start with bullet characters
+    assert_no_bullet_companies(experiences)
+    
     for exp in experiences:
         company = exp.get("company", "")
         
@@ -128,15 +127,15 @@ Account Manager
         if not company:
             continue
         
-        # Company names should never start with bullet characters
-        assert not company.startswith("●"), f"Experience company starts with bullet: {company}"
-        assert not company.startswith("•"), f"Experience company starts with bullet: {company}"
-        assert not company.startswith("-"), f"Experience company starts with dash bullet: {company}"
-        assert not company.startswith("*"), f"Experience company starts with asterisk bullet: {company}"
-        
         # Company names should be actual companies, not achievement descriptions
-        assert "led team" not in company.lower(), f"Achievement bullet parsed as company: {company}"
-        assert "managed" not in company.lower(), f"Achievement bullet parsed as company: {company}"
+        assert not _LED_TEAM_RE.search(company), f"Achievement bullet parsed as company: {company}"
+        assert not _MANAGED_RE.search(company), f"Achievement bullet parsed as company: {company}"
+
+
+def test_fixture_resumes_have_no_bullet_companies(batch_results):
+    """Same guardrail, applied to every fixture resume parsed in the session batch."""
+    for data in batch_results.values():
+        assert_no_bullet_companies(data["candidate_profile"]["experiences"])
 
 
 def test_gonzaga_education_entry_complete():
@@ -156,13 +155,7 @@ Bachelor of Science in Communication Studies
 ● Student Journalist for Gonzaga Bulletin Newspaper
 """.strip()
     
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
-    
-    assert response.status_code == 200
-    data = response.json()
+    data = parse_text(resume_text)
     
     education = data["candidate_profile"].get("education", [])
     assert len(education) >= 1, "Should have at least 1 education entry"
@@ -180,7 +173,4 @@ Bachelor of Science in Communication Studies
     details = gonzaga.get("details", [])
     assert len(details) >= 3, f"Should have at least 3 detail bullets, got {len(details)}: {details}"
     
-    details_text = " ".join(details).lower()
-    assert "applied communications" in details_text, "Should contain 'Applied Communications' in details"
-    assert "cross cultural" in details_text, "Should contain 'Cross Cultural' in details"
-    assert "student journalist" in details_text, "Should contain 'Student Journalist' in details"
+    assert_details_contain(details, "applied communications", "cross cultural", "student journalist")
@@ -5,14 +5,28 @@ Demonstrates how confidence scores guide downstream decision-making about
 whether extraction requires user clarification.
 """
 
-import json
-from fastapi.testclient import TestClient
-from app.main import app
+import pytest
+from conftest import json_of, post_parse
 
-client = TestClient(app)
+# One resume carrying every field the "found" tests check; parsed once per module.
+FULL_FEATURE_RESUME = b"""
+Sarah Williams
+sarah.w@example.com
+555-222-3333
+Austin, Texas
+
+Skills: Python, Java, JavaScript, AWS, Docker
+"""
+
+
+@pytest.fixture(scope="module")
+def full_features(client):
+    response = post_parse(client, FULL_FEATURE_RESUME)
+    assert response.status_code == 200
+    return json_of(response)
 
 
-def test_confidence_scores_present_in_response():
+def test_confidence_scores_present_in_response(client):
     """Verify that all responses include confidence_scores."""
     resume_text = """JOHN DOE
 john.doe@example.com
@@ -22,13 +36,10 @@ San Francisco, California
 Python, JavaScript, AWS
 """
     
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
+    response = post_parse(client, resume_text, params={"minimal": "true"})
     
     assert response.status_code == 200
-    data = response.json()
+    data = json_of(response)
     
     # Verify confidence_scores exist
     assert "confidence_scores" in data
@@ -42,28 +53,16 @@ Python, JavaScript, AWS
     assert "skills" in data["confidence_scores"]
 
 
-def test_email_confidence_high_when_found():
+def test_email_confidence_high_when_found(full_features):
     """Email should have high confidence when extracted via regex."""
-    resume_text = """
-John Doe
-john.doe@example.com
-555-123-4567
-"""
-    
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
-    
-    data = response.json()
-    email_conf = data["confidence_scores"]["email"]
+    email_conf = full_features["confidence_scores"]["email"]
     
     assert email_conf["confidence"] == 1.0
     assert email_conf["extraction_method"] == "regex_exact_single"
     assert email_conf["required"] is True
 
 
-def test_email_confidence_zero_when_not_found():
+def test_email_confidence_zero_when_not_found(client):
     """Email confidence should be 0 when no email is found."""
     resume_text = """
 John Doe
@@ -71,40 +70,24 @@ Some Company
 San Francisco, California
 """
     
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
+    response = post_parse(client, resume_text, params={"minimal": "true"})
     
-    data = response.json()
+    data = json_of(response)
     email_conf = data["confidence_scores"]["email"]
     
     assert email_conf["confidence"] == 0.0
     assert email_conf["extraction_method"] == "not_found"
 
 
-def test_phone_confidence_high_when_found():
+def test_phone_confidence_high_when_found(full_features):
     """Phone should have high confidence when extracted via regex."""
-    resume_text = """
-Jane Smith
-jane.smith@company.com
-503-804-0032
-Portland, Oregon
-"""
-    
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
-    
-    data = response.json()
-    phone_conf = data["confidence_scores"]["phone"]
+    phone_conf = full_features["confidence_scores"]["phone"]
     
     assert phone_conf["confidence"] == 1.0
     assert phone_conf["extraction_method"] == "regex_exact_single"
 
 
-def test_parse_quality_based_on_confidence():
+def test_parse_quality_based_on_confidence(client):
     """Parse quality should reflect confidence in core fields."""
     # High confidence case: all core fields present
     high_confidence_resume = """
@@ -114,12 +97,9 @@ john.doe@example.com
 New York, New York
 """
     
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", high_confidence_resume.encode(), "text/plain")}
-    )
+    response = post_parse(client, high_confidence_resume, params={"minimal": "true"})
     
-    data = response.json()
+    data = json_of(response)
     assert data["parse_quality"] == "high"
     
     # Check that core field confidences are high
@@ -127,7 +107,7 @@ New York, New York
     assert data["confidence_scores"]["phone"]["confidence"] >= 0.85
 
 
-def test_parse_quality_medium_without_phone():
+def test_parse_quality_medium_without_phone(client):
     """Parse quality should be medium if core fields are missing."""
     medium_confidence_resume = """
 John Smith
@@ -135,34 +115,18 @@ john.smith@example.com
 San Francisco, California
 """
     
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", medium_confidence_resume.encode(), "text/plain")}
-    )
+    response = post_parse(client, medium_confidence_resume, params={"minimal": "true"})
     
-    data = response.json()
+    data = json_of(response)
     assert data["parse_quality"] in ["medium", "low"]
     
     # Phone confidence should be 0
     assert data["confidence_scores"]["phone"]["confidence"] == 0.0
 
 
-def test_confidence_scores_structure():
+def test_confidence_scores_structure(full_features):
     """Confidence scores should have required metadata fields."""
-    resume_text = """
-Bob Johnson
-bob@work.com
-415-555-1234
-"""
-    
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
-    
-    data = response.json()
-    
-    for field_name, conf_obj in data["confidence_scores"].items():
+    for field_name, conf_obj in full_features["confidence_scores"].items():
         # Each confidence object should have required fields
         assert "field_name" in conf_obj
         assert "confidence" in conf_obj
@@ -177,69 +141,29 @@ bob@work.com
         assert isinstance(conf_obj["reasons"], list)
 
 
-def test_location_confidence_with_comma():
+def test_location_confidence_with_comma(full_features):
     """Location confidence higher with city, state format."""
-    resume_text = """
-Sarah Williams
-sarah.w@example.com
-555-222-3333
-Austin, Texas
-"""
-    
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
-    
-    data = response.json()
-    loc_conf = data["confidence_scores"]["location"]
+    loc_conf = full_features["confidence_scores"]["location"]
     
     # Should have good confidence
     assert loc_conf["confidence"] >= 0.85
     assert loc_conf["extraction_method"] == "regex_pattern"
 
 
-def test_skills_confidence():
+def test_skills_confidence(full_features):
     """Skills should have appropriate confidence."""
-    resume_text = """
-MICHAEL CHEN
-michael.chen@tech.com
-415-555-9876
-
-Skills: Python, Java, JavaScript, AWS, Docker
-"""
-    
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
-    
-    data = response.json()
-    skills_conf = data["confidence_scores"]["skills"]
+    skills_conf = full_features["confidence_scores"]["skills"]
     
     # Skills found should have good confidence
     assert skills_conf["confidence"] >= 0.80
     assert skills_conf["extraction_method"] == "section_extraction"
-    assert len(data["candidate_profile"]["skills"]) > 0
+    assert len(full_features["candidate_profile"]["skills"]) > 0
 
 
-def test_confidence_in_evidence():
+def test_confidence_in_evidence(full_features):
     """Evidence items should also track confidence."""
-    resume_text = """
-Patricia Lopez
-patricia.lopez@startup.io
-650-555-2020
-"""
-    
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
-    
-    data = response.json()
-    
     # Check email evidence has confidence
-    email_evidence = data["evidence_map"].get("email", [])
+    email_evidence = full_features["evidence_map"].get("email", [])
     assert len(email_evidence) > 0
     
     for ev in email_evidence:
@@ -1,26 +1,21 @@
-from io import BytesIO
-from docx import Document
-from fastapi.testclient import TestClient
-from app.main import app
+from conftest import build_docx_stream, json_of
 
-client = TestClient(app)
 
-def test_parse_docx_extracts_email():
-    doc = Document()
-    doc.add_paragraph("Jane Doe")
-    doc.add_paragraph("jane.doe@example.com")
-    doc.add_paragraph("(555) 123-4567")
-    doc.add_paragraph("Skills: Python, FastAPI")
-
-    buf = BytesIO()
-    doc.save(buf)
+def test_parse_docx_extracts_email(client):
+    # httpx reads the in-memory buffer directly; no bytes copy of the archive
+    docx_stream = build_docx_stream([
+        "Jane Doe",
+        "jane.doe@example.com",
+        "(555) 123-4567",
+        "Skills: Python, FastAPI",
+    ])
 
     files = {
-        "file": ("resume.docx", buf.getvalue(), "application/vnd.openxmlformats-officedocument.wordprocessingml.document")
+        "file": ("resume.docx", docx_stream, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")
     }
     r = client.post("/parse", files=files)
     assert r.status_code == 200
-    data = r.json()
+    data = json_of(r)
 
     assert data["candidate_profile"]["email"] == "jane.doe@example.com"
     assert len(data["evidence_map"]["email"]) >= 1
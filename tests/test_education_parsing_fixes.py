@@ -7,23 +7,10 @@ These tests validate three critical bug fixes:
 3. Degree and field_of_study splitting on " in "
 """
 
-from fastapi.testclient import TestClient
-from app.main import app
+import pytest
+from conftest import assert_details_contain, json_of, parse_text, post_parse
 
-client = TestClient(app)
-
-
-def test_gonzaga_bullet_with_colon_preserved():
-    """
-    Regression test: Bullet with colon must be preserved in details.
-    
-    Bug: "● Applied Communications Major: Social Media/Marketing" was being dropped
-    because the colon was misinterpreted as a new entry header.
-    
-    Fix: Handle bullets FIRST before any colon-based header detection.
-    """
-    
-    resume_text = """
+GONZAGA_WITH_BULLETS = """
 EDUCATION
 
 GONZAGA UNIVERSITY
@@ -34,16 +21,36 @@ Bachelor of Science in Communication Studies
 ● Focus in Cross Cultural Communications / Journalism Minor
 ● Student Journalist for Gonzaga Bulletin Newspaper
 """.strip()
+
+# Single-bullet variant: the original location/date regression input
+STUDY_ABROAD_ONE_BULLET = """
+EDUCATION
+
+DANISH INSTITUTE OF STUDY ABROAD: STUDENT
+Copenhagen, Denmark, Spring Trimester – 2015
+● Study abroad program
+""".strip()
+
+STUDY_ABROAD = STUDY_ABROAD_ONE_BULLET + "\n● International business focus"
+
+
+@pytest.fixture(scope="module")
+def gonzaga_education():
+    """Education entries for GONZAGA_WITH_BULLETS, parsed once for the module."""
+    return parse_text(GONZAGA_WITH_BULLETS)["candidate_profile"].get("education", [])
+
+
+def test_gonzaga_bullet_with_colon_preserved(gonzaga_education):
+    """
+    Regression test: Bullet with colon must be preserved in details.
     
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
+    Bug: "● Applied Communications Major: Social Media/Marketing" was being dropped
+    because the colon was misinterpreted as a new entry header.
     
-    assert response.status_code == 200
-    data = response.json()
+    Fix: Handle bullets FIRST before any colon-based header detection.
+    """
     
-    education = data["candidate_profile"].get("education", [])
+    education = gonzaga_education
     assert len(education) >= 1, "Should have at least 1 education entry"
     
     gonzaga = education[0]
@@ -59,7 +66,7 @@ Bachelor of Science in Communication Studies
     assert len(details) >= 3, f"Should have at least 3 detail bullets, got {len(details)}: {details}"
 
 
-def test_study_abroad_location_date_parsing():
+def test_study_abroad_location_date_parsing(client):
     """
     Regression test: Study abroad "city, country, term – year" format must parse correctly.
     
@@ -70,23 +77,10 @@ def test_study_abroad_location_date_parsing():
     Fix: Add specific regex pattern for study abroad location/date lines.
     """
     
-    resume_text = """
-EDUCATION
-
-DANISH INSTITUTE OF STUDY ABROAD: STUDENT
-Copenhagen, Denmark, Spring Trimester – 2015
-● Study abroad program
-""".strip()
-    
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
-    
+    # Through the /parse route, as an HTTP smoke test for this module
+    response = post_parse(client, STUDY_ABROAD_ONE_BULLET)
     assert response.status_code == 200
-    data = response.json()
-    
-    education = data["candidate_profile"].get("education", [])
+    education = json_of(response)["candidate_profile"].get("education", [])
     assert len(education) >= 1, "Should have at least 1 education entry"
     
     dis = education[0]
@@ -111,7 +105,7 @@ Copenhagen, Denmark, Spring Trimester – 2015
         f"Degree should be 'STUDENT', got: {dis.get('degree')}"
 
 
-def test_degree_field_splitting():
+def test_degree_field_splitting(client):
     """
     Regression test: Degree and field_of_study should be split on " in ".
     
@@ -129,13 +123,10 @@ Spokane, Washington
 Bachelor of Science in Communication Studies
 """.strip()
     
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
+    response = post_parse(client, resume_text)
     
     assert response.status_code == 200
-    data = response.json()
+    data = json_of(response)
     
     education = data["candidate_profile"].get("education", [])
     assert len(education) >= 1, "Should have at least 1 education entry"
@@ -150,41 +141,22 @@ Bachelor of Science in Communication Studies
         f"Field should be 'Communication Studies', got: {gonzaga.get('field_of_study')}"
 
 
-def test_all_gonzaga_bullets_present():
+def test_all_gonzaga_bullets_present(gonzaga_education):
     """
     End-to-end test: Gonzaga should have ALL bullets, including the one with a colon.
     """
     
-    resume_text = """
-EDUCATION
-
-GONZAGA UNIVERSITY
-Spokane, Washington
-2012 – 2016
-Bachelor of Science in Communication Studies
-● Applied Communications Major: Social Media/Marketing
-● Focus in Cross Cultural Communications / Journalism Minor
-● Student Journalist for Gonzaga Bulletin Newspaper
-""".strip()
-    
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
-    
-    assert response.status_code == 200
-    data = response.json()
-    
-    education = data["candidate_profile"].get("education", [])
+    education = gonzaga_education
     gonzaga = education[0]
     details = gonzaga.get("details", [])
     
-    details_text = " ".join(details).lower()
-    
     # All three bullets should be present
-    assert "applied communications" in details_text, "First bullet should be present"
-    assert "cross cultural" in details_text or "journalism" in details_text, "Second bullet should be present"
-    assert "student journalist" in details_text or "gonzaga bulletin" in details_text, "Third bullet should be present"
+    assert_details_contain(
+        details,
+        "applied communications",
+        ("cross cultural", "journalism"),
+        ("student journalist", "gonzaga bulletin"),
+    )
 
 
 def test_study_abroad_complete_entry():
@@ -192,24 +164,7 @@ def test_study_abroad_complete_entry():
     End-to-end test: Study abroad entry should have all fields populated correctly.
     """
     
-    resume_text = """
-EDUCATION
-
-DANISH INSTITUTE OF STUDY ABROAD: STUDENT
-Copenhagen, Denmark, Spring Trimester – 2015
-● Study abroad program
-● International business focus
-""".strip()
-    
-    response = client.post(
-        "/parse",
-        files={"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    )
-    
-    assert response.status_code == 200
-    data = response.json()
-    
-    education = data["candidate_profile"].get("education", [])
+    education = parse_text(STUDY_ABROAD)["candidate_profile"].get("education", [])
     dis = education[0]
     
     # All fields should be populated
@@ -1,20 +1,11 @@
 """Tests for experience extraction from resumes."""
 
-from fastapi.testclient import TestClient
-from app.main import app
+from conftest import json_of, parse_text, post_parse
 
-client = TestClient(app)
 
-
-def test_parse_pdf_resume_extracts_experiences():
+def test_parse_pdf_resume_extracts_experiences(batch_results):
     """Test experience extraction from PDF resume (John Doe)."""
-    with open("tests/fixtures/John Doe Resume 2024  final.pdf", "rb") as f:
-        pdf_bytes = f.read()
-    
-    files = {"file": ("resume.pdf", pdf_bytes, "application/pdf")}
-    r = client.post("/parse", files=files)
-    assert r.status_code == 200
-    data = r.json()
+    data = batch_results["john_doe_pdf"]
     
     # Check that experiences were extracted
     experiences = data["candidate_profile"]["experiences"]
@@ -34,15 +25,9 @@ def test_parse_pdf_resume_extracts_experiences():
     assert len(data["evidence_map"]["experiences"]) > 0, "Should have experience evidence"
 
 
-def test_parse_docx_resume_extracts_experiences():
+def test_parse_docx_resume_extracts_experiences(batch_results):
     """Test experience extraction from DOCX resume (John Doe)."""
-    with open("tests/fixtures/John Doe Resume 2025 (1).docx", "rb") as f:
-        docx_bytes = f.read()
-    
-    files = {"file": ("resume.docx", docx_bytes, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")}
-    r = client.post("/parse", files=files)
-    assert r.status_code == 200
-    data = r.json()
+    data = batch_results["john_doe_docx"]
     
     # Check that experiences were extracted
     experiences = data["candidate_profile"]["experiences"]
@@ -77,10 +62,7 @@ June 2018 - December 2019
 • Wrote unit tests for core modules
 """
     
-    files = {"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    r = client.post("/parse", files=files)
-    assert r.status_code == 200
-    data = r.json()
+    data = parse_text(resume_text)
     
     experiences = data["candidate_profile"]["experiences"]
     assert len(experiences) >= 2, f"Should extract 2 experiences, got {len(experiences)}"
@@ -121,10 +103,7 @@ July 2019 - February 2021
 • Recommended feature prioritization
 """
     
-    files = {"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    r = client.post("/parse", files=files)
-    assert r.status_code == 200
-    data = r.json()
+    data = parse_text(resume_text)
     
     experiences = data["candidate_profile"]["experiences"]
     assert len(experiences) >= 2, f"Should extract at least 2 experiences, got {len(experiences)}"
@@ -149,10 +128,7 @@ DataCorp Inc: Data Scientist: Seattle, WA
 • Reduced query latency by 50%
 """
     
-    files = {"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    r = client.post("/parse", files=files)
-    assert r.status_code == 200
-    data = r.json()
+    data = parse_text(resume_text)
     
     experiences = data["candidate_profile"]["experiences"]
     assert len(experiences) >= 1, f"Should extract experience even without dates, got {len(experiences)}"
@@ -162,7 +138,7 @@ DataCorp Inc: Data Scientist: Seattle, WA
     assert len(exp["achievements"]) > 0, "Should extract achievements"
 
 
-def test_parse_quality_includes_experiences():
+def test_parse_quality_includes_experiences(client):
     """Test that parse quality scoring includes experience extraction."""
     # Resume with all key fields
     full_resume = """John Smith
@@ -177,10 +153,9 @@ Tech Corp: Senior Engineer: Austin, TX
 • Led major project
 """
     
-    files = {"file": ("resume.txt", full_resume.encode(), "text/plain")}
-    r = client.post("/parse", files=files)
+    r = post_parse(client, full_resume)
     assert r.status_code == 200
-    data = r.json()
+    data = json_of(r)
     
     # Should be "high" quality due to experiences + basic fields
     assert data["parse_quality"] in ["high", "medium"], f"Should be high/medium quality, got {data['parse_quality']}"
@@ -1,10 +1,14 @@
 """Tests for H2/H3 hierarchical experience format parsing."""
 
-from fastapi.testclient import TestClient
-from app.main import app
-from app.core.line_parser import parse_lines_to_response
-
-client = TestClient(app)
+from app.core.line_parser import (
+    LINE_BULLET,
+    LINE_DATE_ONLY,
+    LINE_H2_COMPANY_LOCATION,
+    LINE_H3_JOB_TITLE,
+    LINE_TWO_PART_EXPERIENCE,
+    classify_line,
+    parse_lines_to_response,
+)
 
 
 def test_h2_h3_hierarchical_experience_format():
@@ -163,3 +167,13 @@ def test_h2_h3_format_multiple_jobs_same_company():
     assert exp3["start_date"] == "07/2016", f"Expected '07/2016', got {exp3['start_date']}"
     assert exp3["end_date"] == "06/2018", f"Expected '06/2018', got {exp3['end_date']}"
 
+
+def test_classify_line_reports_h2_h3_line_kinds():
+    """Each line kind used by entry grouping is reported by a single classify_line call."""
+    assert classify_line("Bausch & Lomb, Phoenix Valley, AZ") & LINE_H2_COMPANY_LOCATION
+    assert classify_line("BUSINESS DEVELOPMENT MANAGER") & LINE_H3_JOB_TITLE
+    assert classify_line("BUSINESS DEVELOPMENT MANAGER                04/2025 - PRESENT") & LINE_H3_JOB_TITLE
+    assert classify_line("04/2025 - PRESENT") & LINE_DATE_ONLY
+    assert classify_line("• Completed leadership training") == LINE_BULLET
+    assert classify_line("NEODENT: TERRITORY MANAGER") & LINE_TWO_PART_EXPERIENCE
+    assert not classify_line("Bausch & Lomb, Phoenix Valley, AZ") & LINE_H3_JOB_TITLE
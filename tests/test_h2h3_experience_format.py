@@ -1,12 +1,9 @@
 """Tests for H2/H3 hierarchical experience format extraction."""
 
-from fastapi.testclient import TestClient
-from app.main import app
+from conftest import json_of, post_parse
 
-client = TestClient(app)
 
-
-def test_h2h3_hierarchical_experience_format():
+def test_h2h3_hierarchical_experience_format(client):
     """Test experience extraction from H2/H3 hierarchical format.
     
     This format is commonly used in formatted resumes:
@@ -36,10 +33,9 @@ Responsible for managing key accounts and driving revenue growth across Californ
 - Ranked #1 in sales performance among 50+ account managers nationally
 """
     
-    files = {"file": ("resume.txt", resume_text.encode(), "text/plain")}
-    r = client.post("/parse", files=files)
+    r = post_parse(client, resume_text)
     assert r.status_code == 200
-    data = r.json()
+    data = json_of(r)
     
     # Check basic extraction
     assert data["candidate_profile"]["full_name"] is not None
@@ -11,12 +11,12 @@ def test_name_anchored_above_email_beats_headers():
     ]
 
     resp = parse_lines_to_response(lines, source="pdf")
-    data = resp.model_dump()
+    profile = resp.candidate_profile
 
-    assert data["candidate_profile"]["full_name"] == "John Doe"
-    assert data["candidate_profile"]["email"] == "john.doe@example.com"
-    assert data["candidate_profile"]["phone"] == "(555) 123-4567"
-    assert data["candidate_profile"]["location"] == "New York, New York"
+    assert profile.full_name == "John Doe"
+    assert profile.email == "john.doe@example.com"
+    assert profile.phone == "(555) 123-4567"
+    assert profile.location == "New York, New York"
 
     # Evidence should point to the correct line (name line, not EXPERIENCE)
-    assert data["evidence_map"]["full_name"][0]["locator"] == "pdf:page:1:line:1"
+    assert resp.evidence_map["full_name"][0].locator == "pdf:page:1:line:1"
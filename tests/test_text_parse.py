@@ -1,19 +1,16 @@
-from fastapi.testclient import TestClient
-from app.main import app
+from app.core.schemas import MinimalParseResponse
+from conftest import json_of, parse_text, post_parse
 
-client = TestClient(app)
-
-def test_parse_txt_extracts_email_and_evidence():
-    resume = b"""Jane Doe
+RESUME = """Jane Doe
 jane.doe@example.com
 (555) 123-4567
 Skills: Python, FastAPI, SQL
 https://github.com/janedoe
 """
-    files = {"file": ("resume.txt", resume, "text/plain")}
-    r = client.post("/parse", files=files)
-    assert r.status_code == 200
-    data = r.json()
+
+
+def test_parse_txt_extracts_email_and_evidence():
+    data = parse_text(RESUME)
 
     assert data["candidate_profile"]["full_name"] == "Jane Doe"
     assert data["candidate_profile"]["email"] == "jane.doe@example.com"
@@ -22,3 +19,26 @@ https://github.com/janedoe
     # Evidence must exist and point to a line
     assert len(data["evidence_map"]["email"]) >= 1
     assert data["evidence_map"]["email"][0]["locator"].startswith("text:line:")
+
+
+def test_parse_txt_route_smoke(client):
+    """Same resume through the multipart /parse route."""
+    r = post_parse(client, RESUME)
+    assert r.status_code == 200
+    data = json_of(r)
+
+    assert data["candidate_profile"]["email"] == "jane.doe@example.com"
+    assert data["evidence_map"]["email"][0]["locator"] == "text:line:2"
+
+
+def test_parse_minimal_omits_evidence_and_reasons(client):
+    r = post_parse(client, "Jane Doe\njane.doe@example.com\n(555) 123-4567\n", params={"minimal": "true"})
+    assert r.status_code == 200
+    data = json_of(r)
+
+    assert "evidence_map" not in data
+    assert data["candidate_profile"]["email"] == "jane.doe@example.com"
+    assert data["confidence_scores"]["email"]["confidence"] == 1.0
+    assert "reasons" not in data["confidence_scores"]["email"]
+    # Matches the documented minimal=true response schema
+    MinimalParseResponse.model_validate(data)
@@ -0,0 +1,155 @@
+"""
+Unit tests for the education parser's keyword predicates and entry classification.
+
+Imports only app.core.education_parser; the API-level education tests live in
+tests/test_education_extraction.py.
+"""
+
+from app.core.education_parser import (
+    detect_section_type,
+    has_degree_keyword,
+    is_high_school,
+    is_institution_keyword,
+    is_study_abroad,
+    classify_entry_as_education,
+)
+
+
+# ===== SECTION DETECTION TESTS =====
+
+def test_education_section_header_detection():
+    """Test detection of education section headers."""
+    assert detect_section_type("EDUCATION") == "education"
+    assert detect_section_type("  Education  ") == "education"
+    assert detect_section_type("Academic Background") == "education"
+    assert detect_section_type("Education & Training") == "education"
+
+
+def test_experience_section_header_detection():
+    """Test detection of experience section headers."""
+    assert detect_section_type("EXPERIENCE") == "experience"
+    assert detect_section_type("Professional Experience") == "experience"
+    assert detect_section_type("Work Experience") == "experience"
+    assert detect_section_type("Employment") == "experience"
+
+
+def test_non_section_header():
+    """Test that non-headers return None."""
+    assert detect_section_type("John Doe") is None
+    assert detect_section_type("Some company name") is None
+    assert detect_section_type("") is None
+
+
+# ===== DEGREE KEYWORD TESTS =====
+
+def test_degree_keywords_detected():
+    """Test detection of degree keywords."""
+    assert has_degree_keyword("Bachelor of Science in Computer Science")
+    assert has_degree_keyword("Master of Arts")
+    assert has_degree_keyword("B.S. in Engineering")
+    assert has_degree_keyword("M.A. in Philosophy")
+    assert has_degree_keyword("PhD in Physics")
+    assert has_degree_keyword("Doctorate in Medicine")
+
+
+def test_degree_keywords_case_insensitive():
+    """Test that degree detection is case-insensitive."""
+    assert has_degree_keyword("bachelor of science")
+    assert has_degree_keyword("MASTER OF ARTS")
+    assert has_degree_keyword("Ph.D.")
+
+
+def test_non_degree_text():
+    """Test that non-degree text doesn't match."""
+    assert not has_degree_keyword("Senior Software Engineer")
+    assert not has_degree_keyword("Project Manager at Acme Corp")
+
+
+# ===== HIGH SCHOOL TESTS =====
+
+def test_high_school_detection():
+    """Test detection of high school."""
+    assert is_high_school("High School")
+    assert is_high_school("Lincoln High School")
+    assert is_high_school("Secondary School")
+    assert is_high_school("Prep School")
+
+
+def test_high_school_case_insensitive():
+    """Test that high school detection is case-insensitive."""
+    assert is_high_school("HIGH SCHOOL")
+    assert is_high_school("high school")
+
+
+def test_non_high_school():
+    """Test that non-high school doesn't match."""
+    assert not is_high_school("University of California")
+
+
+# ===== INSTITUTION KEYWORD TESTS =====
+
+def test_institution_keywords_detected():
+    """Test detection of institution keywords."""
+    assert is_institution_keyword("University of California")
+    assert is_institution_keyword("Stanford University")
+    assert is_institution_keyword("College of Engineering")
+    assert is_institution_keyword("Institute of Technology")
+    assert is_institution_keyword("State University")
+
+
+def test_institution_case_insensitive():
+    """Test that institution detection is case-insensitive."""
+    assert is_institution_keyword("UNIVERSITY")
+    assert is_institution_keyword("university")
+
+
+def test_non_institution():
+    """Test that non-institution names don't match."""
+    assert not is_institution_keyword("Acme Corporation")
+
+
+# ===== STUDY ABROAD TESTS =====
+
+def test_study_abroad_detection():
+    """Test detection of study abroad programs."""
+    assert is_study_abroad("Study Abroad Program")
+    assert is_study_abroad("DIS Study Abroad")
+    assert is_study_abroad("Institute of Study Abroad")
+
+
+def test_study_abroad_case_insensitive():
+    """Test that study abroad detection is case-insensitive."""
+    assert is_study_abroad("STUDY ABROAD")
+    assert is_study_abroad("study abroad")
+
+
+# ===== CLASSIFICATION TESTS =====
+
+def test_classify_degree_as_education():
+    """Test that entries with degree keywords are classified as education."""
+    entry_lines = [
+        "Gonzaga University: Bachelor of Science in Communication Studies",
+        "Spokane, Washington, 2012 – 2016",
+    ]
+    assert classify_entry_as_education(entry_lines)
+
+
+def test_classify_high_school_as_education():
+    """Test that high school is always education."""
+    entry_lines = ["Lincoln High School", "Lincoln, Nebraska, 2008 – 2012"]
+    assert classify_entry_as_education(entry_lines)
+
+
+def test_classify_study_abroad_as_education():
+    """Test that study abroad is classified as education."""
+    entry_lines = [
+        "DIS Study Abroad, Copenhagen",
+        "Spring Trimester 2015",
+    ]
+    assert classify_entry_as_education(entry_lines)
+
+
+def test_classify_with_education_section_context():
+    """Test that institution keywords in education section classify as education."""
+    entry_lines = ["University of Washington", "Seattle, Washington, 2010 – 2014"]
+    assert classify_entry_as_education(entry_lines, current_section="education")
@@ -0,0 +1,60 @@
+"""
+Unit tests for the optional whole-parse cache in app.core.line_parser.
+
+The cache is off in the shipped configuration (PARSE_CACHE_SIZE=0); these
+tests switch it on for themselves only.
+"""
+
+import pytest
+
+from app.core import line_parser
+
+LINES = [
+    ("text:line:1", "Jane Doe"),
+    ("text:line:2", "jane@example.com"),
+    ("text:line:3", "Skills: Python, SQL"),
+]
+
+
+@pytest.fixture
+def parse_cache(monkeypatch):
+    """Enable the parse cache for one test, starting and ending empty."""
+    monkeypatch.setattr(line_parser, "PARSE_CACHE_SIZE", 8)
+    line_parser._cached_parse_lines.cache_clear()
+    yield line_parser._cached_parse_lines
+    line_parser._cached_parse_lines.cache_clear()
+
+
+def test_cache_disabled_parses_every_call(monkeypatch):
+    """With the shipped default (0) every call parses and the cache stays empty."""
+    monkeypatch.setattr(line_parser, "PARSE_CACHE_SIZE", 0)
+    line_parser._cached_parse_lines.cache_clear()
+
+    first = line_parser.parse_lines_to_response(LINES, source="user")
+    second = line_parser.parse_lines_to_response(LINES, source="user")
+
+    assert first is not second
+    assert first == second
+    assert line_parser._cached_parse_lines.cache_info().currsize == 0
+
+
+def test_cached_parse_matches_uncached(parse_cache):
+    uncached = line_parser._parse_lines_to_response(LINES, source="user")
+    cached = line_parser.parse_lines_to_response(LINES, source="user")
+
+    assert cached == uncached
+
+
+def test_cached_responses_are_independent_copies(parse_cache):
+    """Mutating one returned response must not leak into the next cache hit."""
+    first = line_parser.parse_lines_to_response(LINES, source="user")
+    first.candidate_profile.skills.append("Injected")
+    first.evidence_map["email"][0].text = "mutated"
+    first.warnings.append("mutated")
+
+    second = line_parser.parse_lines_to_response(LINES, source="user")
+
+    assert parse_cache.cache_info().hits == 1
+    assert "Injected" not in second.candidate_profile.skills
+    assert second.evidence_map["email"][0].text == "jane@example.com"
+    assert "mutated" not in second.warnings